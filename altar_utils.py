@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""Rarely used altar maintenance helpers.
+
+Kept out of PriestOfYuleSacrifice so the main module's class dicts stay lean
+and this bytecode only loads if something actually clears the altar.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+
+def _remove_one(entry: os.DirEntry):
+    # DirEntry type checks come from the directory listing — no extra stat
+    if entry.is_file(follow_symlinks=False):
+        if entry.name != "desktop.ini":
+            os.unlink(entry.path)
+    elif entry.is_dir(follow_symlinks=False):
+        # careful: removes directories recursively
+        shutil.rmtree(entry.path)
+
+
+def clear_altar_contents(altar_path: Path):
+    """Empty the altar between challenges. Use with caution."""
+    with os.scandir(altar_path) as it:
+        entries = list(it)
+    if not entries:
+        return
+    # Deletes are latency-bound (worse on OneDrive-backed desktops);
+    # overlapping them across threads hides the per-call wait
+    with ThreadPoolExecutor(max_workers=min(16, len(entries))) as ex:
+        futures = {ex.submit(_remove_one, e): e for e in entries}
+        for fut in as_completed(futures):
+            try:
+                fut.result()
+            except Exception as e:
+                print(f"[ERR] Failed to remove {futures[fut].path}: {e}")